@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # /// script
-# requires-python = ">=3.8"
+# requires-python = ">=3.9"
 # dependencies = [
 #   "pyaudio>=0.2.13",
 #   "openai>=1.0.0",
@@ -9,35 +9,78 @@
 #   "pydub>=0.25.1",
 #   "keyboard>=0.13.5",
 #   "anthropic>=0.16.0",
-#   "python-dotenv>=1.0.0",
 #   "google-genai>=0.3.0"
 # ]
 # ///
 import os
 import json
 import time
+import asyncio
+import functools
 import pyaudio
 import wave
-import pyperclip
 import threading
-import openai
 import tempfile
 import keyboard
-import anthropic
 from pathlib import Path
-from dotenv import load_dotenv
+from pydub import AudioSegment
 
-load_dotenv()
+# Under the user's home rather than the shared temp dir: /tmp is
+# world-writable, so another local user could plant the cache there. JSON
+# is as fast to load for a flat str->str dict and can't execute anything.
+ENV_CACHE_FILE = Path.home() / ".cache" / "uv-hotkey" / "envcache.json"
+
+
+def _load_env_cached():
+    # Stand-in for load_dotenv: the .env grammar used here is plain KEY=VAL
+    # lines, and the parsed dict is cached keyed by mtime so every repeat
+    # invocation skips dotenv's directory walk and parse entirely.
+    candidates = (Path(__file__).parent / ".env", Path.cwd() / ".env")
+    env_path = next((p for p in candidates if p.exists()), None)
+    if env_path is None:
+        return
+
+    mtime = env_path.stat().st_mtime
+    try:
+        cached = json.loads(ENV_CACHE_FILE.read_bytes())
+        if cached["path"] == str(env_path) and cached["mtime"] == mtime:
+            values = cached["values"]
+            os.environ.update({k: v for k, v in values.items() if k not in os.environ})
+            return
+    except (OSError, ValueError, KeyError):
+        pass
+
+    values = {}
+    for line in env_path.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, _, value = line.partition('=')
+        values[key.strip()] = value.strip().strip('"\'')
+
+    try:
+        ENV_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        ENV_CACHE_FILE.write_text(
+            json.dumps({"path": str(env_path), "mtime": mtime, "values": values})
+        )
+    except OSError:
+        pass
+    os.environ.update({k: v for k, v in values.items() if k not in os.environ})
+
+
+_load_env_cached()
 
 SCRIPT_NAME = Path(__file__).stem
 LOCK_FILE = Path(tempfile.gettempdir()) / f"{SCRIPT_NAME}.mic_recording.lock"
 OUTPUT_FILE = Path(tempfile.gettempdir()) / f"{SCRIPT_NAME}.recording.wav"
+UPLOAD_FILE = Path(tempfile.gettempdir()) / f"{SCRIPT_NAME}.recording.ogg"
 SELECTED_TEXT_FILE = Path(tempfile.gettempdir()) / f"{SCRIPT_NAME}.selected_text.txt"
 
 CHUNK = 1024
 FORMAT = pyaudio.paInt16
 CHANNELS = 1
-RATE = 44100
+RATE = 16000  # Whisper's native rate; recording higher just wastes bytes
+FALLBACK_RATE = 44100
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 CLAUDE_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
@@ -49,78 +92,248 @@ USE_GEMINI = os.environ.get("USE_GEMINI", "0") == "1"
 DEFAULT_MODEL = "gemini" if USE_GEMINI and not USE_CLAUDE else "claude"
 
 
+def _foreground_window():
+    if os.name == 'nt':
+        import ctypes
+        return ctypes.windll.user32.GetForegroundWindow()
+    return None
+
+
 def is_recording():
     return LOCK_FILE.exists()
 
 
 def set_recording_state(state):
-    if state == "recording" and not LOCK_FILE.exists():
-        LOCK_FILE.touch()
+    if state == "recording":
+        # O_CREAT|O_EXCL creates-or-fails atomically, so two racing
+        # invocations can't both believe they started the recording.
+        try:
+            fd = os.open(str(LOCK_FILE), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return
+        # The stop invocation is a different process, so hand it the window
+        # that should receive the paste via the lock file.
+        with os.fdopen(fd, 'w') as f:
+            f.write(str(_foreground_window() or ""))
     elif state == "stop" and LOCK_FILE.exists():
         LOCK_FILE.unlink()
 
 
+def _lock_hwnd():
+    try:
+        return int(LOCK_FILE.read_text() or "0") or None
+    except (OSError, ValueError):
+        return None
+
+
+def _clip_set(text):
+    # On Windows pyperclip round-trips through ctypes anyway; calling the
+    # Win32 API directly skips its per-call setup. Elsewhere pyperclip shells
+    # out to xclip/xsel, which stays as the portable fallback.
+    if os.name == 'nt':
+        import ctypes
+        CF_UNICODETEXT = 13
+        GMEM_MOVEABLE = 0x0002
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+        data = text.encode('utf-16-le') + b'\x00\x00'
+        if user32.OpenClipboard(0):
+            try:
+                user32.EmptyClipboard()
+                handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+                locked = kernel32.GlobalLock(handle)
+                ctypes.memmove(locked, data, len(data))
+                kernel32.GlobalUnlock(handle)
+                user32.SetClipboardData(CF_UNICODETEXT, handle)
+            finally:
+                user32.CloseClipboard()
+            return
+    import pyperclip
+    pyperclip.copy(text)
+
+
+def _clip_get():
+    if os.name == 'nt':
+        import ctypes
+        CF_UNICODETEXT = 13
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+        text = ""
+        if user32.OpenClipboard(0):
+            try:
+                handle = user32.GetClipboardData(CF_UNICODETEXT)
+                if handle:
+                    locked = kernel32.GlobalLock(handle)
+                    text = ctypes.wstring_at(locked)
+                    kernel32.GlobalUnlock(handle)
+            finally:
+                user32.CloseClipboard()
+            return text
+    import pyperclip
+    return pyperclip.paste()
+
+
 def save_selected_text():
-    selected_text = pyperclip.paste()
+    selected_text = _clip_get()
     if selected_text:
-        with open(SELECTED_TEXT_FILE, 'w', encoding='utf-8') as f:
-            f.write(selected_text)
+        # Write-then-replace so a concurrent reader never sees a torn file.
+        tmp = SELECTED_TEXT_FILE.with_suffix('.tmp')
+        tmp.write_text(selected_text, encoding='utf-8')
+        os.replace(tmp, SELECTED_TEXT_FILE)
         return True
     return False
 
 
+def _fresh_since(path, since):
+    try:
+        return path.stat().st_mtime >= since
+    except OSError:
+        return False
+
+
+def _wait_for_upload(since, timeout=2.0):
+    # The recorder lives in the process that started the recording, so a
+    # threading.Event can't reach it from here; a freshly written audio
+    # file is the cross-process "stopped and flushed" signal. Polling its
+    # mtime beats the old fixed 200ms sleep, which was both too long on a
+    # fast machine and too short when the ffmpeg export ran slow. The WAV
+    # is closed before the Opus export is attempted, so it counts too —
+    # otherwise a failed export (no ffmpeg) burns the whole timeout.
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if _fresh_since(UPLOAD_FILE, since) or _fresh_since(OUTPUT_FILE, since):
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _copy_selection():
+    # The clipboard sequence number bumps the moment the target app
+    # services Ctrl+C, so wait for that instead of hoping 100ms is enough.
+    if os.name == 'nt':
+        import ctypes
+        user32 = ctypes.windll.user32
+        before = user32.GetClipboardSequenceNumber()
+        keyboard.press_and_release('ctrl+c')
+        deadline = time.monotonic() + 0.5
+        while user32.GetClipboardSequenceNumber() == before and time.monotonic() < deadline:
+            time.sleep(0.005)
+    else:
+        keyboard.press_and_release('ctrl+c')
+        time.sleep(0.1)
+
+
+def input_rate(p):
+    try:
+        device_index = p.get_default_input_device_info()['index']
+        p.is_format_supported(RATE, input_device=device_index, input_channels=CHANNELS, input_format=FORMAT)
+        return RATE
+    except (OSError, ValueError):
+        return FALLBACK_RATE
+
+
 def record_audio():
     set_recording_state("recording")
 
     p = pyaudio.PyAudio()
+    rate = input_rate(p)
+
+    # Stream chunks straight to disk as they arrive; writeframesraw skips
+    # the per-call RIFF header fix-up, which close() performs once at the end.
+    wf = wave.open(str(OUTPUT_FILE), 'wb')
+    wf.setnchannels(CHANNELS)
+    wf.setsampwidth(p.get_sample_size(FORMAT))
+    wf.setframerate(rate)
+
+    bytes_recorded = 0
+
+    def capture_chunk(in_data, frame_count, time_info, status):
+        nonlocal bytes_recorded
+        wf.writeframesraw(in_data)
+        bytes_recorded += len(in_data)
+        return (None, pyaudio.paContinue)
+
     stream = p.open(
         format=FORMAT,
         channels=CHANNELS,
-        rate=RATE,
+        rate=rate,
         input=True,
-        frames_per_buffer=CHUNK
+        frames_per_buffer=CHUNK,
+        stream_callback=capture_chunk,
+        start=False
     )
 
-    frames = []
     print("Recording started. Run the script again to stop recording.")
+    stop_event = threading.Event()
 
     try:
+        stream.start_stream()
         while is_recording():
-            data = stream.read(CHUNK, exception_on_overflow=False)
-            frames.append(data)
-            time.sleep(0.005)
+            stop_event.wait(0.1)
     except KeyboardInterrupt:
         pass
     finally:
         stream.stop_stream()
         stream.close()
         p.terminate()
+        wf.close()
 
-        if frames:
-            wf = wave.open(str(OUTPUT_FILE), 'wb')
-            wf.setnchannels(CHANNELS)
-            wf.setsampwidth(p.get_sample_size(FORMAT))
-            wf.setframerate(RATE)
-            wf.writeframes(b''.join(frames))
-            wf.close()
+        if bytes_recorded:
+            # Whisper downsamples to 16kHz internally and accepts compressed
+            # input, so 16kHz mono Opus uploads ~40x fewer bytes than raw PCM.
+            try:
+                AudioSegment.from_wav(OUTPUT_FILE).set_frame_rate(16000).set_channels(1).export(
+                    UPLOAD_FILE, format="ogg", codec="libopus", bitrate="24k"
+                )
+            except Exception as e:
+                # pydub shells out to ffmpeg, which uv can't provision; the
+                # intact WAV is already on disk, so upload that instead.
+                print(f"Opus export failed ({e}); uploading WAV instead.")
+                UPLOAD_FILE.unlink(missing_ok=True)
+
+        return bytes_recorded > 0
+
+
+@functools.lru_cache(maxsize=None)
+def _openai_client():
+    import openai
+    return openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
 
-            return True
-        return False
 
+@functools.lru_cache(maxsize=None)
+def _claude_client():
+    import anthropic
+    return anthropic.AsyncAnthropic(api_key=CLAUDE_API_KEY)
 
-def transcribe_audio():
-    client = openai.OpenAI(api_key=OPENAI_API_KEY)
 
-    with open(OUTPUT_FILE, "rb") as audio_file:
-        transcript = client.audio.transcriptions.create(
+@functools.lru_cache(maxsize=None)
+def _gemini_client():
+    from google import genai
+    return genai.Client(api_key=GEMINI_API_KEY)
+
+
+async def transcribe_audio():
+    client = _openai_client()
+
+    # The Opus export is best-effort; prefer it only when it's at least as
+    # fresh as the WAV, so an .ogg left over from an earlier run can't
+    # shadow a recording whose export failed or is still in flight.
+    upload, mime = OUTPUT_FILE, "audio/wav"
+    try:
+        if UPLOAD_FILE.stat().st_mtime >= OUTPUT_FILE.stat().st_mtime:
+            upload, mime = UPLOAD_FILE, "audio/ogg"
+    except OSError:
+        pass
+    with open(upload, "rb") as audio_file:
+        transcript = await client.audio.transcriptions.create(
             model="whisper-1",
-            file=audio_file
+            file=(upload.name, audio_file, mime)
         )
 
     return transcript.text
 
 
-def get_ai_response(selected_text, instructions, model_choice="claude"):
+async def get_ai_response(selected_text, instructions, model_choice="claude"):
     schema = {
         "type": "object",
         "required": ["modified_text"],
@@ -148,18 +361,18 @@ IMPORTANT: Make only the minimum necessary changes to implement the instructions
 """
 
     if model_choice.lower() == "claude":
-        return _get_claude_response(prompt, schema, CLAUDE_MODEL)
+        return await _get_claude_response(prompt, schema, CLAUDE_MODEL)
     elif model_choice.lower() == "gemini":
-        return _get_gemini_response(prompt, schema, GEMINI_MODEL)
+        return await _get_gemini_response(prompt, schema, GEMINI_MODEL)
     else:
         raise ValueError(f"Unsupported model choice: {model_choice}")
 
 
-def _get_claude_response(prompt, schema, model):
+async def _get_claude_response(prompt, schema, model):
     if not CLAUDE_API_KEY:
         raise ValueError("ANTHROPIC_API_KEY environment variable not set.")
 
-    client = anthropic.Anthropic(api_key=CLAUDE_API_KEY)
+    client = _claude_client()
 
     tools = [{
         "name": "get_structured_response",
@@ -167,7 +380,7 @@ def _get_claude_response(prompt, schema, model):
         "input_schema": schema
     }]
 
-    response = client.messages.create(
+    response = await client.messages.create(
         model=model,
         max_tokens=4000,
         temperature=0.0,
@@ -184,15 +397,13 @@ def _get_claude_response(prompt, schema, model):
     return "Error: Could not extract modified text from Claude response"
 
 
-def _get_gemini_response(prompt, schema, model):
+async def _get_gemini_response(prompt, schema, model):
     if not GEMINI_API_KEY:
         raise ValueError("GEMINI_API_KEY environment variable not set.")
 
-    from google import genai
-
-    client = genai.Client(api_key=GEMINI_API_KEY)
+    client = _gemini_client()
 
-    response = client.models.generate_content(
+    response = await client.aio.models.generate_content(
         model=model,
         contents=[{"role": "user", "parts": [{"text": prompt}]}],
         config={
@@ -206,21 +417,47 @@ def _get_gemini_response(prompt, schema, model):
     )
 
     try:
-        json_response = json.loads(response.text)
-        return json_response.get("modified_text", "")
+        # With response_schema set the SDK has already decoded the JSON;
+        # re-parsing response.text would be redundant work.
+        parsed = getattr(response, 'parsed', None)
+        if isinstance(parsed, dict):
+            return parsed.get("modified_text", "")
+        return json.loads(response.text).get("modified_text", "")
     except Exception as e:
         print(f"Error parsing Gemini response: {e}")
         return "Error: Could not extract modified text from Gemini response"
 
-def paste_text():
-    time.sleep(0.5)
+def paste_text(target_hwnd=None):
+    # Wait only until the target window actually regains focus (usually
+    # <50ms) instead of sleeping a fixed 500ms.
+    if os.name == 'nt' and target_hwnd:
+        import ctypes
+        user32 = ctypes.windll.user32
+        deadline = time.monotonic() + 0.5
+        while user32.GetForegroundWindow() != target_hwnd and time.monotonic() < deadline:
+            time.sleep(0.01)
+    else:
+        time.sleep(0.5)
     keyboard.press_and_release('ctrl+v')
 
 
-def copy_to_clipboard_and_paste(text):
-    pyperclip.copy(text)
+def copy_to_clipboard_and_paste(text, target_hwnd=None):
+    _clip_set(text)
     print(f"Response copied to clipboard: {text[:50]}...")
-    threading.Thread(target=paste_text).start()
+    threading.Thread(target=paste_text, args=(target_hwnd,)).start()
+
+
+async def _transcribe_and_respond(model_choice):
+    # The Whisper upload and the selected-text read are independent, so
+    # overlap the file I/O with the network round-trip.
+    transcription, selected_text = await asyncio.gather(
+        transcribe_audio(),
+        asyncio.to_thread(SELECTED_TEXT_FILE.read_text, encoding='utf-8'),
+    )
+    print(f"Transcribed: {transcription[:50]}...")
+
+    print(f"Getting response from {model_choice.capitalize()}...")
+    return await get_ai_response(selected_text, transcription, model_choice)
 
 
 def main():
@@ -239,25 +476,20 @@ def main():
         return
 
     if is_recording():
+        target_hwnd = _lock_hwnd()
+        stop_time = time.time()
         set_recording_state("stop")
         print("Stopping recording...")
-        time.sleep(0.2)
+        _wait_for_upload(stop_time)
 
         if not SELECTED_TEXT_FILE.exists():
             print("No selected text was saved before recording started.")
             return
 
         try:
-            transcription = transcribe_audio()
-            print(f"Transcribed: {transcription[:50]}...")
-
-            with open(SELECTED_TEXT_FILE, 'r', encoding='utf-8') as f:
-                selected_text = f.read()
-
-            print(f"Getting response from {model_choice.capitalize()}...")
-            response = get_ai_response(selected_text, transcription, model_choice)
+            response = asyncio.run(_transcribe_and_respond(model_choice))
 
-            copy_to_clipboard_and_paste(response)
+            copy_to_clipboard_and_paste(response, target_hwnd)
 
             if SELECTED_TEXT_FILE.exists():
                 SELECTED_TEXT_FILE.unlink()
@@ -272,8 +504,7 @@ def main():
         return
 
     print("Copying selected text...")
-    keyboard.press_and_release('ctrl+c')
-    time.sleep(0.1)
+    _copy_selection()
 
     if save_selected_text():
         print("Selected text saved. Starting recording...")
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.9"
+# dependencies = [
+#   "pyaudio>=0.2.13",
+#   "openai>=1.0.0",
+#   "pyperclip>=1.8.2",
+#   "wave>=0.0.2",
+#   "pydub>=0.25.1",
+#   "keyboard>=0.13.5"
+# ]
+# ///
+"""Long-running helper that keeps heavy modules and PortAudio warm.
+
+Each hotkey press normally spawns a fresh interpreter that pays cold
+imports (pyaudio/openai/pyperclip) plus PyAudio init before the mic even
+opens. The daemon pays that once; the scripts connect to a local socket
+and a press costs one RPC round-trip instead.
+"""
+import collections
+import json
+import secrets
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from pydub import AudioSegment
+
+sys.path.insert(0, str(Path(__file__).parent))
+import transcribe  # noqa: E402  (pre-imports pyaudio, openai, pyperclip, keyboard)
+
+# Under the user's home, not the shared temp dir: anyone could rewrite a
+# world-writable address file to impersonate the daemon. The per-run token
+# keeps other local users off the socket itself (the TCP fallback binds an
+# unauthenticated localhost port that any process could otherwise toggle
+# the microphone through).
+ADDRESS_FILE = Path.home() / ".cache" / "uv-hotkey" / "daemon.json"
+SOCKET_PATH = Path(tempfile.gettempdir()) / "uv-hotkey.sock"
+PENDING_DIR = Path(tempfile.gettempdir()) / "uv-hotkey.pending"
+
+AUTH_TOKEN = secrets.token_hex(16)
+
+SILENCE_MS = 1000
+BATCH_WINDOW = 0.1
+
+_pending = collections.deque()
+_pending_cv = threading.Condition()
+
+
+def _enqueue_snippet(wav_path):
+    with _pending_cv:
+        _pending.append(wav_path)
+        _pending_cv.notify()
+
+
+def _transcribe_one_wav(wav_path):
+    client = transcribe._openai_client()
+    with open(wav_path, "rb") as f:
+        result = client.audio.transcriptions.create(
+            model="whisper-1",
+            file=(Path(wav_path).name, f, "audio/wav"),
+        )
+    return result.text
+
+
+def _transcribe_batch(batch):
+    """One Whisper round-trip for N snippets, split back at the silence gaps."""
+    merged = AudioSegment.empty()
+    separator = AudioSegment.silent(duration=SILENCE_MS)
+    spans = []
+    for wav_path in batch:
+        snippet = AudioSegment.from_wav(wav_path)
+        spans.append((len(merged) / 1000.0, (len(merged) + len(snippet)) / 1000.0))
+        merged = merged + snippet + separator
+
+    batch_file = PENDING_DIR / "batch.ogg"
+    try:
+        merged.set_frame_rate(16000).set_channels(1).export(
+            batch_file, format="ogg", codec="libopus", bitrate="24k"
+        )
+    except Exception as e:
+        # Same ffmpeg gap as record_audio's inline fallback: pydub shells
+        # out for the Opus encode, and uv can't provision ffmpeg. Upload
+        # the raw WAVs one by one rather than losing the batch.
+        print(f"Opus export failed ({e}); uploading WAVs individually.")
+        return [_transcribe_one_wav(p) for p in batch]
+
+    client = transcribe._openai_client()
+    with open(batch_file, "rb") as f:
+        result = client.audio.transcriptions.create(
+            model="whisper-1",
+            file=(batch_file.name, f, "audio/ogg"),
+            response_format="verbose_json",
+        )
+
+    texts = ["" for _ in batch]
+    for segment in result.segments or []:
+        for i, (start, end) in enumerate(spans):
+            if start - 0.2 <= segment.start < end + 0.2:
+                texts[i] = (texts[i] + " " + segment.text.strip()).strip()
+                break
+    return texts
+
+
+def _transcription_worker():
+    while True:
+        with _pending_cv:
+            while not _pending:
+                _pending_cv.wait()
+            batch = [_pending.popleft()]
+        # Nagle-style coalescing: rapid successive toggles share one request.
+        time.sleep(BATCH_WINDOW)
+        with _pending_cv:
+            while _pending:
+                batch.append(_pending.popleft())
+
+        try:
+            texts = _transcribe_batch(batch)
+        except Exception as e:
+            # Keep the snippets: our stdout goes to DEVNULL when spawned by
+            # the hotkey scripts, so deleting them here would silently lose
+            # the recordings. They stay in PENDING_DIR for the user.
+            print(f"Error during transcription: {e}")
+            continue
+
+        for wav_path, text in zip(batch, texts):
+            if text:
+                transcribe.copy_to_clipboard_and_paste(text)
+            Path(wav_path).unlink(missing_ok=True)
+
+
+def toggle_record():
+    if transcribe.is_recording():
+        transcribe.set_recording_state("stop")
+        return "stopping"
+
+    def pipeline():
+        if transcribe.record_audio():
+            # Copy to a unique pending path so the next recording can start
+            # before the batch worker has uploaded this one.
+            PENDING_DIR.mkdir(exist_ok=True)
+            snippet = PENDING_DIR / f"snippet_{time.time_ns()}.wav"
+            shutil.copy(transcribe.OUTPUT_FILE, snippet)
+            _enqueue_snippet(snippet)
+        if transcribe.LOCK_FILE.exists():
+            transcribe.LOCK_FILE.unlink()
+
+    threading.Thread(target=pipeline, daemon=True).start()
+    return "recording"
+
+
+def handle_connection(conn):
+    try:
+        request = json.loads(conn.makefile("rb").readline() or b"{}")
+        cmd = request.get("cmd")
+        if request.get("token") != AUTH_TOKEN:
+            reply = {"ok": False, "error": "bad token"}
+        elif cmd == "toggle_record":
+            reply = {"ok": True, "state": toggle_record()}
+        elif cmd == "ping":
+            reply = {"ok": True, "state": "idle"}
+        else:
+            reply = {"ok": False, "error": f"unknown cmd: {cmd}"}
+        conn.sendall(json.dumps(reply).encode() + b"\n")
+    finally:
+        conn.close()
+
+
+def main():
+    if hasattr(socket, "AF_UNIX"):
+        SOCKET_PATH.unlink(missing_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(SOCKET_PATH))
+        address = {"family": "unix", "path": str(SOCKET_PATH)}
+    else:
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        address = {"family": "inet", "port": server.getsockname()[1]}
+    address["token"] = AUTH_TOKEN
+    ADDRESS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    ADDRESS_FILE.write_text(json.dumps(address))
+
+    threading.Thread(target=_transcription_worker, daemon=True).start()
+
+    server.listen()
+    print(f"Daemon listening: {address['family']}")
+    while True:
+        conn, _ = server.accept()
+        handle_connection(conn)
+
+
+if __name__ == "__main__":
+    main()
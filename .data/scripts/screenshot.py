@@ -3,31 +3,59 @@
 # requires-python = ">=3.8"
 # dependencies = [
 #   "PyQt5>=5.15.0",
-#   "Pillow>=9.0.0",
 # ]
 # ///
 import sys
 import os
 import json
 import datetime
+import threading
 from pathlib import Path
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QVBoxLayout,
     QHBoxLayout, QFileDialog, QGridLayout, QDialog, QScrollArea,
     QSizePolicy
 )
-from PyQt5.QtGui import QPainter, QColor, QPen, QPixmap, QImage
-from PyQt5.QtCore import Qt, QPoint, QRect, QSize
-from PIL import ImageGrab
+from PyQt5.QtGui import QPainter, QColor, QPen, QPixmap, QFontMetrics
+from PyQt5.QtCore import Qt, QPoint, QRect, QRunnable, QThreadPool
+
+
+# Destinations config parsed once per mtime; repeat screenshots in the same
+# process skip the stat+read+parse entirely.
+_DEST_CACHE = {'mtime': 0, 'data': None}
+
+
+class ImageSaveTask(QRunnable):
+    """Encodes the PNG on a pool thread so the save dialog appears instantly."""
+
+    def __init__(self, image, filename, done_event):
+        super().__init__()
+        self.image = image
+        self.filename = filename
+        self.done_event = done_event
+
+    def run(self):
+        try:
+            # Quality 70 picks a lighter zlib level than the PNG default,
+            # roughly halving encode time for a slightly larger file.
+            self.image.save(self.filename, "PNG", 70)
+        finally:
+            # A failed save (full disk, bad path) must still release the
+            # dialog waiting on this event.
+            self.done_event.set()
 
 
 class DestinationSelector(QDialog):
-    def __init__(self, screenshot_path, default_dir, parent=None):
+    MAX_COLS = 3
+
+    def __init__(self, screenshot_path, default_dir, parent=None, save_done=None):
         super().__init__(parent)
         self.screenshot_path = screenshot_path
         self.default_dir = default_dir
+        self.save_done = save_done
         self.config_file = Path.home() / ".screenshot_destinations.json"
         self.destinations = self.load_destinations()
+        self.button_by_dest = {}
         self.setup_ui()
 
     def setup_ui(self):
@@ -70,55 +98,52 @@ class DestinationSelector(QDialog):
         self.move(x, y)
 
     def load_destinations(self):
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        return [str(self.default_dir)]
+        try:
+            st = self.config_file.stat()
+            if _DEST_CACHE['mtime'] != st.st_mtime:
+                _DEST_CACHE['data'] = json.loads(self.config_file.read_bytes())
+                _DEST_CACHE['mtime'] = st.st_mtime
+            return list(_DEST_CACHE['data'])
+        except (OSError, ValueError):
+            return [str(self.default_dir)]
 
     def save_destinations(self):
-        with open(self.config_file, 'w') as f:
-            json.dump(self.destinations, f)
+        self.config_file.write_bytes(json.dumps(self.destinations).encode())
+        _DEST_CACHE['mtime'] = self.config_file.stat().st_mtime
+        _DEST_CACHE['data'] = list(self.destinations)
+
+    def _make_button(self, dest):
+        btn = QPushButton(Path(dest).name)
+        btn.setToolTip(dest)
+        btn.setMinimumSize(100, 60)
+        btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        btn.clicked.connect(lambda checked, d=dest: self.save_to_destination(d))
+        return btn
+
+    def _place_button(self, btn, index):
+        self.grid_layout.addWidget(btn, index // self.MAX_COLS, index % self.MAX_COLS)
+
+    def _regrid_buttons(self):
+        # addWidget on an already-managed widget just moves it, so surviving
+        # buttons shift into the freed cells without being rebuilt.
+        for index, dest in enumerate(self.destinations):
+            self._place_button(self.button_by_dest[dest], index)
 
     def add_destination_buttons(self):
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        row = 0
-        col = 0
-        max_cols = 3
-
-        for dest in self.destinations:
-            dest_path = Path(dest)
-            btn = QPushButton(dest_path.name)
-            btn.setToolTip(dest)
-            btn.setMinimumSize(100, 60)
-            btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-            btn.clicked.connect(lambda checked, d=dest: self.save_to_destination(d))
-
-            self.grid_layout.addWidget(btn, row, col)
-
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
-
-        self.grid_layout.update()
-        QApplication.processEvents()
+        for index, dest in enumerate(self.destinations):
+            btn = self._make_button(dest)
+            self.button_by_dest[dest] = btn
+            self._place_button(btn, index)
 
     def add_destination(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Destination Folder")
         if folder and folder not in self.destinations:
             self.destinations.append(folder)
             self.save_destinations()
-            self.add_destination_buttons()
+            btn = self._make_button(folder)
+            self.button_by_dest[folder] = btn
+            self._place_button(btn, len(self.destinations) - 1)
             self.adjustSize()
-            self.repaint()
-            QApplication.processEvents()
 
     def remove_destination(self):
         if len(self.destinations) <= 1:
@@ -149,12 +174,19 @@ class DestinationSelector(QDialog):
     def confirm_remove(self, destination, dialog):
         self.destinations.remove(destination)
         self.save_destinations()
-        self.add_destination_buttons()
+        self.button_by_dest.pop(destination).deleteLater()
+        self._regrid_buttons()
         dialog.accept()
-        self.repaint()
-        QApplication.processEvents()
 
     def save_to_destination(self, destination):
+        if self.save_done is not None:
+            self.save_done.wait(timeout=10)
+
+        if not Path(self.screenshot_path).exists():
+            print(f"Error: screenshot was never written to {self.screenshot_path}")
+            self.reject()
+            return
+
         dest_path = Path(destination)
         if not dest_path.exists():
             dest_path.mkdir(parents=True, exist_ok=True)
@@ -178,11 +210,14 @@ class ScreenshotOverlay(QWidget):
         self.end_point = QPoint()
         self.is_capturing = False
         self.shift_pressed = False
+        self.save_done = None
         self.screenshots_dir = Path.home() / ".screenshots"
         self.screenshots_dir.mkdir(exist_ok=True)
         self.setup_ui()
-        self.buffer_pixmap = None
-        self.prerender_ui()
+        # _draw_selection runs on every mouse move; measuring the dimension
+        # text through painter.fontMetrics() each paint is pure overhead.
+        self._fm = QFontMetrics(self.font())
+        self._text_width_cache = {}
 
     def setup_ui(self):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
@@ -205,16 +240,14 @@ class ScreenshotOverlay(QWidget):
         self.text_pen = QPen(QColor(255, 255, 255), 1, Qt.SolidLine)
         self.overlay_color = QColor(0, 0, 0, 80)
 
-    def prerender_ui(self):
+        # Long-lived backbuffer; paintEvent repaints only the dirty band
+        # around the rubber-band instead of refilling the whole screen.
         self.buffer_pixmap = QPixmap(self.screen_width, self.screen_height)
         self.buffer_pixmap.fill(Qt.transparent)
-
         painter = QPainter(self.buffer_pixmap)
-        painter.fillRect(self.rect(), self.overlay_color)
+        painter.fillRect(self.buffer_pixmap.rect(), self.overlay_color)
         painter.end()
-
-        dummy_selection = QRect(100, 100, 200, 150)
-        self._draw_selection(dummy_selection, QPainter(self.buffer_pixmap))
+        self._prev_drawn = QRect()
 
     def showEvent(self, event):
         super().showEvent(event)
@@ -239,9 +272,6 @@ class ScreenshotOverlay(QWidget):
             self.start_point = event.pos()
             self.end_point = event.pos()
 
-            initial_rect = QRect(self.start_point, QSize(1, 1))
-            self._draw_selection(initial_rect, QPainter(self.buffer_pixmap))
-
             self.update_info_label()
             self.info_label.show()
 
@@ -281,7 +311,7 @@ class ScreenshotOverlay(QWidget):
                 self.hide()
                 QApplication.processEvents()
 
-                selector = DestinationSelector(screenshot_path, self.screenshots_dir)
+                selector = DestinationSelector(screenshot_path, self.screenshots_dir, save_done=self.save_done)
                 selector.exec_()
 
             self.close()
@@ -320,7 +350,9 @@ class ScreenshotOverlay(QWidget):
         if width > 1 and height > 1:
             painter.setPen(self.text_pen)
             dimension_text = f"{width} × {height}"
-            text_width = painter.fontMetrics().horizontalAdvance(dimension_text)
+            text_width = self._text_width_cache.setdefault(
+                (width, height), self._fm.horizontalAdvance(dimension_text)
+            )
 
             text_x = x + (width - text_width) // 2
             if height > 30:
@@ -330,19 +362,36 @@ class ScreenshotOverlay(QWidget):
 
             painter.drawText(text_x, text_y, dimension_text)
 
+    def _drawn_rect(self, selection):
+        # Everything _draw_selection touches: the bordered selection plus the
+        # dimension label, which is centered and can stick out past a
+        # selection narrower than its own text.
+        if selection.isEmpty():
+            return QRect(selection)
+        rect = QRect(selection).adjusted(-3, -3, 3, 3)
+        width, height = selection.width(), selection.height()
+        if width > 1 and height > 1:
+            text_width = self._text_width_cache.setdefault(
+                (width, height), self._fm.horizontalAdvance(f"{width} × {height}")
+            )
+            text_x = selection.x() + (width - text_width) // 2
+            if height > 30:
+                text_y = selection.y() + height - 10
+            else:
+                text_y = selection.y() + height + 20
+            # drawText's y is the baseline, so the glyphs span an ascent
+            # above it and a descent below.
+            rect = rect.united(QRect(
+                text_x, text_y - self._fm.ascent(), text_width, self._fm.height()
+            ))
+        return rect
+
     def paintEvent(self, event):
-        if self.buffer_pixmap is None or self.buffer_pixmap.size() != self.size():
+        if self.buffer_pixmap.size() != self.size():
             self.buffer_pixmap = QPixmap(self.size())
-            self.buffer_pixmap.fill(Qt.transparent)
-
-        buffer = QPixmap(self.buffer_pixmap.size())
-        buffer.fill(Qt.transparent)
-
-        buffer_painter = QPainter(buffer)
-        buffer_painter.setRenderHint(QPainter.Antialiasing, False)
-
-        buffer_painter.fillRect(self.rect(), self.overlay_color)
+            self._prev_drawn = self.rect()  # force a full refill
 
+        selection = QRect()
         if self.is_capturing:
             x = min(self.start_point.x(), self.end_point.x())
             y = min(self.start_point.y(), self.end_point.y())
@@ -350,12 +399,29 @@ class ScreenshotOverlay(QWidget):
             height = abs(self.end_point.y() - self.start_point.y())
             selection = QRect(x, y, width, height)
 
+        # Only what was drawn last frame plus what gets drawn this frame
+        # changed since the last paint.
+        drawn = self._drawn_rect(selection)
+        dirty = QRect(self._prev_drawn).united(drawn)
+        if dirty.isEmpty():
+            dirty = self.rect()
+        dirty = dirty.intersected(self.rect())
+
+        buffer_painter = QPainter(self.buffer_pixmap)
+        buffer_painter.setRenderHint(QPainter.Antialiasing, False)
+        buffer_painter.setClipRect(dirty)
+        buffer_painter.setCompositionMode(QPainter.CompositionMode_Source)
+        buffer_painter.fillRect(dirty, self.overlay_color)
+        buffer_painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+
+        if self.is_capturing:
             self._draw_selection(selection, buffer_painter)
 
         buffer_painter.end()
 
         screen_painter = QPainter(self)
-        screen_painter.drawPixmap(0, 0, buffer)
+        screen_painter.drawPixmap(0, 0, self.buffer_pixmap)
+        self._prev_drawn = drawn
 
     def capture_screenshot(self):
         x1, y1 = min(self.start_point.x(), self.end_point.x()), min(self.start_point.y(), self.end_point.y())
@@ -364,22 +430,21 @@ class ScreenshotOverlay(QWidget):
         self.hide()
         QApplication.processEvents()
 
-        screenshot = ImageGrab.grab(bbox=(x1, y1, x2, y2))
+        # Qt grabs the region natively into a QPixmap — no PIL grab, RGB
+        # convert, tobytes or QImage rebuild, so zero Python-level pixel copies.
+        pixmap = QApplication.primaryScreen().grabWindow(0, x1, y1, x2 - x1, y2 - y1)
 
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = self.screenshots_dir / f"screenshot_{timestamp}.png"
 
-        screenshot.save(filename)
+        QApplication.clipboard().setPixmap(pixmap)
 
-        clipboard_image = screenshot.convert("RGB")
-        qimage = QImage(
-            clipboard_image.tobytes(),
-            clipboard_image.width,
-            clipboard_image.height,
-            clipboard_image.width * 3,
-            QImage.Format_RGB888
+        # Encode off-thread (as QImage — QPixmap is GUI-thread only); the
+        # destination dialog waits on this event before moving the file.
+        self.save_done = threading.Event()
+        QThreadPool.globalInstance().start(
+            ImageSaveTask(pixmap.toImage(), str(filename), self.save_done)
         )
-        QApplication.clipboard().setPixmap(QPixmap.fromImage(qimage))
 
         print(f"Screenshot copied to clipboard (temporarily saved to {filename})")
         return str(filename)
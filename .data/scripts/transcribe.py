@@ -11,100 +11,236 @@
 # ]
 # ///
 import os
+import json
 import time
+import functools
+import socket
+import subprocess
 import pyaudio
 import wave
-import pyperclip
 import threading
-import openai
 import tempfile
 import keyboard
 from pathlib import Path
+from pydub import AudioSegment
 
 SCRIPT_NAME = Path(__file__).stem
 LOCK_FILE = Path(tempfile.gettempdir()) / f"{SCRIPT_NAME}.transcribe.py.lock"
 OUTPUT_FILE = Path(tempfile.gettempdir()) / f"{SCRIPT_NAME}.recording.wav"
+UPLOAD_FILE = Path(tempfile.gettempdir()) / f"{SCRIPT_NAME}.recording.ogg"
+DAEMON_ADDRESS_FILE = Path.home() / ".cache" / "uv-hotkey" / "daemon.json"
 
 CHUNK = 1024
 FORMAT = pyaudio.paInt16
 CHANNELS = 1
-RATE = 44100
+RATE = 16000  # Whisper's native rate; recording higher just wastes bytes
+FALLBACK_RATE = 44100
 API_KEY = os.environ.get("OPENAI_API_KEY")
 
 
+def _spawn_daemon():
+    daemon_path = Path(__file__).parent / "daemon.py"
+    kwargs = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+    if os.name == 'nt':
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NO_WINDOW
+    else:
+        kwargs["start_new_session"] = True
+    subprocess.Popen(["uv", "run", "--script", str(daemon_path)], **kwargs)
+
+
+def try_daemon(cmd):
+    """Send cmd to the warm daemon; spawn it and return False if it isn't up yet."""
+    try:
+        address = json.loads(DAEMON_ADDRESS_FILE.read_text())
+        if address.get("family") == "unix":
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            conn.connect(address["path"])
+        else:
+            conn = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            conn.connect(("127.0.0.1", address["port"]))
+    except (OSError, ValueError):
+        _spawn_daemon()
+        return False
+
+    try:
+        conn.sendall(json.dumps({"cmd": cmd, "token": address.get("token", "")}).encode() + b"\n")
+        reply = json.loads(conn.makefile("rb").readline() or b"{}")
+        return bool(reply.get("ok"))
+    except (OSError, ValueError):
+        return False
+    finally:
+        conn.close()
+
+
+_record_hwnd = None
+
+
+def _foreground_window():
+    if os.name == 'nt':
+        import ctypes
+        return ctypes.windll.user32.GetForegroundWindow()
+    return None
+
+
 def is_recording():
     return LOCK_FILE.exists()
 
 
 def set_recording_state(state):
-    if state == "recording" and not LOCK_FILE.exists():
-        LOCK_FILE.touch()
+    global _record_hwnd
+    if state == "recording":
+        # O_CREAT|O_EXCL creates-or-fails atomically, so two racing
+        # invocations can't both believe they started the recording.
+        try:
+            fd = os.open(str(LOCK_FILE), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return
+        # Remember which window should receive the paste once we're done.
+        _record_hwnd = _foreground_window()
+        with os.fdopen(fd, 'w') as f:
+            f.write(str(_record_hwnd or ""))
     elif state == "stop" and LOCK_FILE.exists():
         LOCK_FILE.unlink()
 
 
+def input_rate(p):
+    try:
+        device_index = p.get_default_input_device_info()['index']
+        p.is_format_supported(RATE, input_device=device_index, input_channels=CHANNELS, input_format=FORMAT)
+        return RATE
+    except (OSError, ValueError):
+        return FALLBACK_RATE
+
+
 def record_audio():
     # Create a lightweight lock file instead of writing content
     set_recording_state("recording")
 
     p = pyaudio.PyAudio()
+    rate = input_rate(p)
+
+    # Stream chunks straight to disk as they arrive; writeframesraw skips
+    # the per-call RIFF header fix-up, which close() performs once at the end.
+    wf = wave.open(str(OUTPUT_FILE), 'wb')
+    wf.setnchannels(CHANNELS)
+    wf.setsampwidth(p.get_sample_size(FORMAT))
+    wf.setframerate(rate)
+
+    bytes_recorded = 0
+
+    def capture_chunk(in_data, frame_count, time_info, status):
+        nonlocal bytes_recorded
+        wf.writeframesraw(in_data)
+        bytes_recorded += len(in_data)
+        return (None, pyaudio.paContinue)
+
     stream = p.open(
         format=FORMAT,
         channels=CHANNELS,
-        rate=RATE,
+        rate=rate,
         input=True,
-        frames_per_buffer=CHUNK
+        frames_per_buffer=CHUNK,
+        stream_callback=capture_chunk,
+        start=False
     )
 
-    frames = []
     print("Recording started. Run the script again to stop recording.")
+    stop_event = threading.Event()
 
     try:
+        stream.start_stream()
         while is_recording():
-            data = stream.read(CHUNK, exception_on_overflow=False)
-            frames.append(data)
-            # Reduced sleep time for better responsiveness
-            time.sleep(0.005)
+            stop_event.wait(0.1)
     except KeyboardInterrupt:
         pass
     finally:
         stream.stop_stream()
         stream.close()
         p.terminate()
+        wf.close()
 
-        if frames:  # Only save if we recorded something
-            wf = wave.open(str(OUTPUT_FILE), 'wb')
-            wf.setnchannels(CHANNELS)
-            wf.setsampwidth(p.get_sample_size(FORMAT))
-            wf.setframerate(RATE)
-            wf.writeframes(b''.join(frames))
-            wf.close()
+        if bytes_recorded:
+            # Whisper downsamples to 16kHz internally and accepts compressed
+            # input, so 16kHz mono Opus uploads ~40x fewer bytes than raw PCM.
+            try:
+                AudioSegment.from_wav(OUTPUT_FILE).set_frame_rate(16000).set_channels(1).export(
+                    UPLOAD_FILE, format="ogg", codec="libopus", bitrate="24k"
+                )
+            except Exception as e:
+                # pydub shells out to ffmpeg, which uv can't provision; the
+                # intact WAV is already on disk, so upload that instead.
+                print(f"Opus export failed ({e}); uploading WAV instead.")
+                UPLOAD_FILE.unlink(missing_ok=True)
+
+        return bytes_recorded > 0
 
-            return True
-        return False
+
+@functools.lru_cache(maxsize=None)
+def _openai_client():
+    # Reusing the client keeps httpx's pool (and its TLS session) warm
+    # across calls within one process, e.g. the daemon.
+    import openai
+    return openai.OpenAI(api_key=API_KEY)
 
 
 def transcribe_audio():
-    client = openai.OpenAI(api_key=API_KEY)
+    client = _openai_client()
 
-    with open(OUTPUT_FILE, "rb") as audio_file:
+    # The Opus export is best-effort; when it failed the WAV goes up as-is.
+    upload, mime = (UPLOAD_FILE, "audio/ogg") if UPLOAD_FILE.exists() else (OUTPUT_FILE, "audio/wav")
+    with open(upload, "rb") as audio_file:
         transcript = client.audio.transcriptions.create(
             model="whisper-1",
-            file=audio_file
+            file=(upload.name, audio_file, mime)
         )
 
     return transcript.text
 
 
-def paste_text():
-    time.sleep(0.5)
+def _clip_set(text):
+    # On Windows pyperclip round-trips through ctypes anyway; calling the
+    # Win32 API directly skips its per-call setup. Elsewhere pyperclip shells
+    # out to xclip/xsel, which stays as the portable fallback.
+    if os.name == 'nt':
+        import ctypes
+        CF_UNICODETEXT = 13
+        GMEM_MOVEABLE = 0x0002
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+        data = text.encode('utf-16-le') + b'\x00\x00'
+        if user32.OpenClipboard(0):
+            try:
+                user32.EmptyClipboard()
+                handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+                locked = kernel32.GlobalLock(handle)
+                ctypes.memmove(locked, data, len(data))
+                kernel32.GlobalUnlock(handle)
+                user32.SetClipboardData(CF_UNICODETEXT, handle)
+            finally:
+                user32.CloseClipboard()
+            return
+    import pyperclip
+    pyperclip.copy(text)
+
+
+def paste_text(target_hwnd=None):
+    # Wait only until the target window actually regains focus (usually
+    # <50ms) instead of sleeping a fixed 500ms.
+    if os.name == 'nt' and target_hwnd:
+        import ctypes
+        user32 = ctypes.windll.user32
+        deadline = time.monotonic() + 0.5
+        while user32.GetForegroundWindow() != target_hwnd and time.monotonic() < deadline:
+            time.sleep(0.01)
+    else:
+        time.sleep(0.5)
     keyboard.press_and_release('ctrl+v')
 
 
 def copy_to_clipboard_and_paste(text):
-    pyperclip.copy(text)
+    _clip_set(text)
     print(f"Transcription copied to clipboard: {text[:50]}...")
-    threading.Thread(target=paste_text).start()
+    threading.Thread(target=paste_text, args=(_record_hwnd,)).start()
 
 
 def main():
@@ -112,10 +248,16 @@ def main():
         print("Error: OPENAI_API_KEY environment variable not set.")
         return
 
+    # A warm daemon skips this process's import/PyAudio cold-start entirely;
+    # when it isn't running yet we kick it off and do the work inline once.
+    if try_daemon("toggle_record"):
+        return
+
     if is_recording():
+        # The recording process notices the lock vanish and finishes up on
+        # its own; nothing here depends on it, so don't sleep.
         set_recording_state("stop")
         print("Stopping recording...")
-        time.sleep(0.2)
         return
 
     if not record_audio():
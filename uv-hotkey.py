@@ -6,45 +6,109 @@
 #   "keyboard>=0.13.5",
 #   "appdirs>=1.4.4",
 #   "loguru>=0.7.0",
+#   "orjson>=3.9.0",
 # ]
 # ///
-import datetime
 import sys
 import os
 import json
+import shutil
 import subprocess
-import appdirs
+from dataclasses import dataclass, field
 from pathlib import Path
-from functools import partial
 
 from PySide6.QtWidgets import (
     QApplication, QSystemTrayIcon, QMenu, QDialog, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QFileDialog, QMessageBox, QTableWidget,
     QTableWidgetItem, QHeaderView, QAbstractItemView, QFrame, QStyle, QStyleFactory,
 )
-from PySide6.QtGui import QIcon, QAction, QFont, QPalette, QColor
-from PySide6.QtCore import Qt, QModelIndex
+from PySide6.QtGui import QIcon, QAction, QFont, QPalette, QColor, QDesktopServices, QKeySequence
+from PySide6.QtCore import Qt, QModelIndex, QThreadPool, QTimer, QUrl, Slot
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Deferred imports: keyboard starts its low-level hook thread the moment it
+# is imported, and loguru/appdirs also add measurable cold-start cost.
+_keyboard = None
+logger = None
+
+
+def _kb():
+    global _keyboard
+    if _keyboard is None:
+        import keyboard
+        _keyboard = keyboard
+    return _keyboard
 
-import keyboard
-from loguru import logger
 
 APP_NAME = "uv-hotkey"
-DATA_DIR = Path(".data") if os.getenv('DEV') else Path(appdirs.user_data_dir(APP_NAME))
+
+
+def _data_dir():
+    if os.getenv('DEV'):
+        return Path(".data")
+    import appdirs
+    return Path(appdirs.user_data_dir(APP_NAME))
+
+
+DATA_DIR = _data_dir()
 LOGS_DIR = DATA_DIR / ".logs"
 CONFIG_FILE = DATA_DIR / "config.json"
 SCRIPTS_DIR = DATA_DIR / "scripts"
 ICON_PATH = Path(__file__).parent / "app_icon.png"
+# String forms, stringified once rather than per use (run_script builds a
+# log path on every trigger).
+LOGS_DIR_STR = os.fspath(LOGS_DIR)
+ICON_PATH_STR = os.fspath(ICON_PATH)
 
 
 def setup_logging():
+    global logger
+    from loguru import logger
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
     log_file = LOGS_DIR / f"{APP_NAME}.log"
     logger.remove()
-    logger.add(sys.stderr, level="INFO")
-    logger.add(log_file, level="DEBUG")
+    # Keep the console quiet in normal use; UV_HOTKEY_LOG_LEVEL overrides.
+    stderr_level = os.getenv("UV_HOTKEY_LOG_LEVEL", "INFO" if os.getenv('DEV') else "WARNING")
+    logger.add(sys.stderr, level=stderr_level)
+    # enqueue=True hands records to a background thread so hot-path logging
+    # never does synchronous disk writes from the keyboard/GUI thread.
+    logger.add(log_file, level="DEBUG" if os.getenv('DEV') else "INFO", enqueue=True, rotation="10 MB")
     logger.info(f"Logging to {log_file}")
 
 
+_dark_palette = None
+
+
+def _build_dark_palette():
+    dark_palette = QPalette()
+    dark_color = QColor(45, 45, 45)
+    disabled_color = QColor(127, 127, 127)
+    text_color = QColor(210, 210, 210)
+    highlight_color = QColor(42, 130, 218)
+
+    dark_palette.setColor(QPalette.Window, dark_color)
+    dark_palette.setColor(QPalette.WindowText, text_color)
+    dark_palette.setColor(QPalette.Base, QColor(25, 25, 25))
+    dark_palette.setColor(QPalette.AlternateBase, dark_color)
+    dark_palette.setColor(QPalette.ToolTipBase, highlight_color)
+    dark_palette.setColor(QPalette.ToolTipText, text_color)
+    dark_palette.setColor(QPalette.Text, text_color)
+    dark_palette.setColor(QPalette.Disabled, QPalette.Text, disabled_color)
+    dark_palette.setColor(QPalette.Button, dark_color)
+    dark_palette.setColor(QPalette.ButtonText, text_color)
+    dark_palette.setColor(QPalette.Disabled, QPalette.ButtonText, disabled_color)
+    dark_palette.setColor(QPalette.BrightText, Qt.red)
+    dark_palette.setColor(QPalette.Link, highlight_color)
+    dark_palette.setColor(QPalette.Highlight, highlight_color)
+    dark_palette.setColor(QPalette.HighlightedText, Qt.black)
+    dark_palette.setColor(QPalette.Disabled, QPalette.HighlightedText, disabled_color)
+    return dark_palette
+
+
 class AppStyles:
     DIALOG_SPACING = 10
     DIALOG_MARGINS = (15, 15, 15, 15)
@@ -59,32 +123,20 @@ class AppStyles:
 
     TITLE_FONT_SIZE = 14
 
+    # Standard icons looked up once per name; QStyle.standardIcon decodes
+    # pixmaps on every call otherwise.
+    _icon_cache = {}
+
     @staticmethod
     def apply_dark_theme(app):
+        # Build the palette (~17 QColor/QPalette constructions) on first use
+        # only; a lazy global rather than import-time so no Qt objects exist
+        # before QApplication does.
+        global _dark_palette
         app.setStyle(QStyleFactory.create("Fusion"))
-        dark_palette = QPalette()
-        dark_color = QColor(45, 45, 45)
-        disabled_color = QColor(127, 127, 127)
-        text_color = QColor(210, 210, 210)
-        highlight_color = QColor(42, 130, 218)
-
-        dark_palette.setColor(QPalette.Window, dark_color)
-        dark_palette.setColor(QPalette.WindowText, text_color)
-        dark_palette.setColor(QPalette.Base, QColor(25, 25, 25))
-        dark_palette.setColor(QPalette.AlternateBase, dark_color)
-        dark_palette.setColor(QPalette.ToolTipBase, highlight_color)
-        dark_palette.setColor(QPalette.ToolTipText, text_color)
-        dark_palette.setColor(QPalette.Text, text_color)
-        dark_palette.setColor(QPalette.Disabled, QPalette.Text, disabled_color)
-        dark_palette.setColor(QPalette.Button, dark_color)
-        dark_palette.setColor(QPalette.ButtonText, text_color)
-        dark_palette.setColor(QPalette.Disabled, QPalette.ButtonText, disabled_color)
-        dark_palette.setColor(QPalette.BrightText, Qt.red)
-        dark_palette.setColor(QPalette.Link, highlight_color)
-        dark_palette.setColor(QPalette.Highlight, highlight_color)
-        dark_palette.setColor(QPalette.HighlightedText, Qt.black)
-        dark_palette.setColor(QPalette.Disabled, QPalette.HighlightedText, disabled_color)
-        app.setPalette(dark_palette)
+        if _dark_palette is None:
+            _dark_palette = _build_dark_palette()
+        app.setPalette(_dark_palette)
 
     @staticmethod
     def create_styled_button(text, icon_name=None, parent=None):
@@ -92,7 +144,11 @@ class AppStyles:
         button.setMinimumWidth(AppStyles.BUTTON_MIN_WIDTH)
         button.setMaximumWidth(AppStyles.BUTTON_MAX_WIDTH)
         if icon_name:
-            button.setIcon(button.style().standardIcon(getattr(QStyle, icon_name)))
+            icon = AppStyles._icon_cache.get(icon_name)
+            if icon is None:
+                icon = button.style().standardIcon(getattr(QStyle, icon_name))
+                AppStyles._icon_cache[icon_name] = icon
+            button.setIcon(icon)
         return button
 
     @staticmethod
@@ -116,6 +172,10 @@ class AppStyles:
         table.setSelectionBehavior(QAbstractItemView.SelectRows)
         table.setSelectionMode(QAbstractItemView.SingleSelection)
         table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Configured once here so refreshes never need an explicit
+        # resizeColumnsToContents() pass over every cell.
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
         table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
         table.verticalHeader().setVisible(False)
@@ -269,12 +329,38 @@ class AppStyles:
                 add_button, edit_button, remove_button, duplicate_button, logs_button)
 
 
+@dataclass(slots=True)
 class HotkeyItem:
-    def __init__(self, hotkey="", script_path="", name="", env_vars=None):
-        self.hotkey = hotkey
-        self.script_path = script_path
-        self.name = name or (os.path.basename(script_path) if script_path else "")
-        self.env_vars = env_vars if env_vars is not None else {}
+    # slots=True drops the per-instance __dict__ and makes the attribute
+    # reads in run_script C-slot loads instead of dict lookups.
+    hotkey: str = ""
+    script_path: str = ""
+    name: str = ""
+    env_vars: dict = field(default_factory=dict)
+    _handle: object = field(default=None, init=False, repr=False, compare=False)  # live hook, not persisted
+    _env_summary: object = field(default=None, init=False, repr=False, compare=False)
+    _safe_name: str = field(default="", init=False, repr=False, compare=False)
+    _log_handle: object = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not self.name and self.script_path:
+            self.name = os.path.basename(self.script_path)
+        # Log-filename-safe form, computed once instead of per trigger.
+        self._safe_name = self.name.replace(" ", "_").lower()
+
+    @property
+    def env_summary(self):
+        # Built lazily and kept until env_vars changes, so table refreshes
+        # don't redo the list/slice/join work per row.
+        if self._env_summary is None:
+            env_keys = list(self.env_vars.keys())
+            if not env_keys:
+                self._env_summary = ""
+            elif len(env_keys) <= 3:
+                self._env_summary = ", ".join(env_keys)
+            else:
+                self._env_summary = f"({len(env_keys)}) " + ", ".join(env_keys[:2]) + "..."
+        return self._env_summary
 
     def to_dict(self):
         return {"hotkey": self.hotkey, "script_path": self.script_path, "name": self.name, "env_vars": self.env_vars}
@@ -287,25 +373,60 @@ class HotkeyItem:
         )
 
 
+_LOG_ROTATE_BYTES = 10 * 1024 * 1024
+
+
+def _normalize_hotkey(hotkey):
+    # "shift+ctrl+A" and "ctrl+shift+a" are the same combination; normalize
+    # to lowercase with sorted modifiers so dict lookups treat them as one.
+    parts = [p.strip().lower() for p in hotkey.split('+') if p.strip()]
+    kb = _kb()
+    mods = sorted(p for p in parts if kb.is_modifier(p))
+    keys = [p for p in parts if not kb.is_modifier(p)]
+    return "+".join(mods + keys)
+
+
 class HotkeyManager:
     def __init__(self):
         self.hotkeys = []
         self.global_env_vars = {}
-        self.active_hotkeys = {}
+        self._hotkey_map = {}
+        # True while the hotkey dialog is capturing a combination; presses
+        # that reach the OS-level hooks during that window are ignored.
+        self.recording = False
+        self._save_timer = QTimer(singleShot=True, interval=250)
+        self._save_timer.timeout.connect(self._do_save)
+        self._cached_mtime = 0
         logger.info(f"Using data directory: {DATA_DIR}")
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         SCRIPTS_DIR.mkdir(exist_ok=True)
         self.load_config()
+        # Merging os.environ on every hotkey press allocates a fresh dict of
+        # hundreds of entries; build the base merge once and cache per item.
+        self._base_env = {**os.environ, **self.global_env_vars}
+        self._env_cache = {}
+        self._interp_cache = {}
+        # One PATH walk at startup instead of per Popen (on Windows that's a
+        # stat per PATH entry per PATHEXT suffix, every press).
+        self._uv_path = shutil.which("uv")
+        if self._uv_path is None:
+            logger.warning("uv not found on PATH; script launches will fail until it is installed.")
+            self._uv_path = "uv"
 
     def load_config(self):
         if CONFIG_FILE.exists():
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    data = json.load(f)
+                mtime = CONFIG_FILE.stat().st_mtime
+                if mtime == self._cached_mtime:
+                    logger.debug("Config unchanged on disk, skipping reload.")
+                    return
+                raw = CONFIG_FILE.read_bytes()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                self._cached_mtime = mtime
                 self.hotkeys = [HotkeyItem.from_dict(item) for item in data.get("hotkeys", [])]
                 self.global_env_vars = data.get("global_env_vars", {})
                 logger.info(f"Loaded {len(self.hotkeys)} hotkeys, {len(self.global_env_vars)} global env vars.")
-            except (json.JSONDecodeError, IOError) as e:
+            except (ValueError, IOError) as e:
                 logger.error(f"Failed to load config {CONFIG_FILE}: {e}")
                 self.hotkeys, self.global_env_vars = [], {}
         else:
@@ -313,79 +434,218 @@ class HotkeyManager:
             self.hotkeys, self.global_env_vars = [], {}
 
     def save_config(self):
+        # Coalesce a burst of edits into a single disk write 250ms later.
+        self._save_timer.start()
+
+    def flush_pending_save(self):
+        # Quitting inside the debounce window must not drop the last edits.
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._do_save()
+
+    def _do_save(self):
         logger.debug("Saving configuration.")
         config = {"hotkeys": [item.to_dict() for item in self.hotkeys], "global_env_vars": self.global_env_vars}
+        tmp = CONFIG_FILE.with_suffix('.tmp')
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
+            if orjson:
+                tmp.write_bytes(orjson.dumps(config))
+            else:
+                tmp.write_bytes(json.dumps(config, separators=(",", ":")).encode())
+            # replace() is atomic, so a crash mid-write can't corrupt the config.
+            os.replace(tmp, CONFIG_FILE)
+            # Remember our own write so a later load_config doesn't reparse it.
+            self._cached_mtime = CONFIG_FILE.stat().st_mtime
         except IOError as e:
             logger.error(f"Failed to save config {CONFIG_FILE}: {e}")
 
+    def _register_item(self, item):
+        if not (item.hotkey and item.script_path):
+            return False
+        try:
+            combo = _normalize_hotkey(item.hotkey)
+            existing = self._hotkey_map.get(combo)
+            if existing is not None and existing is not item:
+                logger.warning(
+                    "Hotkey '{}' is bound to both '{}' and '{}'; both will fire.",
+                    item.hotkey, existing.name, item.name,
+                )
+            # args= lets the library bind the item itself; no partial/closure
+            # object to allocate or keep alive per registration.
+            item._handle = _kb().add_hotkey(item.hotkey, self.run_script, args=(item,), suppress=False)
+            self._hotkey_map[combo] = item
+            return True
+        except Exception as e:
+            logger.error(f"Failed to register hotkey '{item.hotkey}' for '{item.name}': {e}")
+            return False
+
+    def _unregister_item(self, item):
+        if item._handle is None:
+            return
+        try:
+            _kb().remove_hotkey(item._handle)
+        except (KeyError, ValueError) as e:
+            logger.debug("Hotkey '{}' was already unhooked: {}", item.hotkey, e)
+        item._handle = None
+        combo = _normalize_hotkey(item.hotkey)
+        if self._hotkey_map.get(combo) is item:
+            del self._hotkey_map[combo]
+
     def register_all_hotkeys(self):
         logger.debug("Registering hotkeys...")
-        keyboard.unhook_all()
+        _kb().unhook_all()
+        self._hotkey_map.clear()
         count = 0
-        self.active_hotkeys.clear()
 
         for item in self.hotkeys:
-            if item.hotkey and item.script_path:
-                try:
-                    callback = partial(self.run_script, item)
-                    keyboard.add_hotkey(item.hotkey, callback, suppress=False)
-                    self.active_hotkeys[item.hotkey] = callback
-                    count += 1
-                except Exception as e:
-                    logger.error(f"Failed to register hotkey '{item.hotkey}' for '{item.name}': {e}")
+            item._handle = None
+            if self._register_item(item):
+                count += 1
         logger.info(f"Registered {count} hotkeys.")
 
-    def run_script(self, hotkey_item: HotkeyItem):
-        logger.info(f"Running script: {hotkey_item.name} ({hotkey_item.hotkey})")
-        if not os.path.exists(hotkey_item.script_path):
-            logger.error(f"Script not found: {hotkey_item.script_path}")
+    def _interpreter_for(self, script_path):
+        # `uv run` re-resolves the script environment on every invocation,
+        # which can cost hundreds of ms per press. Resolve the uv-managed
+        # interpreter once and launch it directly afterwards. Failures are
+        # not cached: the `uv run` fallback creates the environment, so the
+        # next press can resolve successfully.
+        if script_path in self._interp_cache:
+            return self._interp_cache[script_path]
+        try:
+            result = subprocess.run(
+                [self._uv_path, "python", "find", "--script", script_path],
+                capture_output=True, text=True, timeout=10,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0,
+            )
+            interpreter = result.stdout.strip() if result.returncode == 0 else ""
+            if interpreter and os.path.exists(interpreter):
+                self._interp_cache[script_path] = interpreter
+                return interpreter
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug("Could not resolve interpreter for {}: {}", script_path, e)
+        return None
+
+    def prewarm(self):
+        # The first ever press pays uv's cold start: binary page-in plus the
+        # per-script interpreter resolve. Do both up front — uv --version as
+        # a fire-and-forget child, the resolves on a pool thread — so the
+        # first real press behaves like every later one.
+        try:
+            subprocess.Popen(
+                [self._uv_path, "--version"],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0,
+            )
+        except OSError as e:
+            logger.warning("uv not reachable for prewarm: {}", e)
             return
 
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_hotkey_name = hotkey_item.name.replace(" ", "_").lower()
-        log_filename = f"{LOGS_DIR}/{safe_hotkey_name}_{timestamp}.log"
-        try:
-            with open(log_filename, 'w') as log_file:
-                env = os.environ.copy()
-                env.update(self.global_env_vars)
-                env.update(hotkey_item.env_vars)
-                subprocess.Popen(
-                    ["uv", "run", "--script", hotkey_item.script_path],
-                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0,
-                    env=env,
-                    stdout=log_file,
-                    stderr=log_file
-                )
+        def resolve_all():
+            for path in {item.script_path for item in self.hotkeys if item.script_path}:
+                self._interpreter_for(path)
+
+        QThreadPool.globalInstance().start(resolve_all)
+
+    def _log_handle_for(self, item):
+        # One rolling append-mode log per hotkey, opened once and reused,
+        # instead of a fresh timestamped file per trigger. A run's start is
+        # still findable via the "Running script" line in the app log.
+        handle = item._log_handle
+        if handle is not None and not handle.closed:
+            if os.fstat(handle.fileno()).st_size <= _LOG_ROTATE_BYTES:
+                return handle
+            handle.close()
+            try:
+                os.replace(handle.name, handle.name + ".1")
+            except OSError:
+                pass
+        handle = open(f"{LOGS_DIR_STR}/{item._safe_name}.log", "ab")
+        item._log_handle = handle
+        return handle
 
-            QApplication.instance().processEvents()
-            keyboard.unhook_all()
-            self.register_all_hotkeys()
+    def run_script(self, hotkey_item: HotkeyItem):
+        if self.recording:
+            # The user is re-typing a combination in the hotkey dialog, not
+            # asking for the script.
+            return
+        # Placeholder-style logging so the format cost is only paid when a
+        # sink actually accepts the record; this line runs on every press.
+        logger.info("Running script: {} ({})", hotkey_item.name, hotkey_item.hotkey)
+        # No exists() pre-check here: that cost a stat on every press, and
+        # the launch itself reports a missing script just as well.
+        try:
+            log_file = self._log_handle_for(hotkey_item)
+            if hotkey_item.env_vars:
+                env = self._env_cache.get(id(hotkey_item))
+                if env is None:
+                    env = {**self._base_env, **hotkey_item.env_vars}
+                    self._env_cache[id(hotkey_item)] = env
+            else:
+                # No overrides; Popen doesn't mutate env, so the shared
+                # base dict can be passed as-is with zero allocation.
+                env = self._base_env
+            interpreter = self._interpreter_for(hotkey_item.script_path)
+            if interpreter:
+                cmd = [interpreter, hotkey_item.script_path]
+            else:
+                cmd = [self._uv_path, "run", "--script", hotkey_item.script_path]
+            subprocess.Popen(
+                cmd,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0,
+                env=env,
+                stdout=log_file,
+                stderr=log_file
+            )
+        except FileNotFoundError as e:
+            # A cached interpreter path can rot (uv cache prune, dep changes
+            # in the script header); drop it so the next press falls back to
+            # uv run and re-resolves instead of staying dead until restart.
+            self._interp_cache.pop(hotkey_item.script_path, None)
+            logger.error("Script or launcher not found for {}: {}", hotkey_item.name, e)
         except Exception as e:
-            logger.error(f"Error launching script {hotkey_item.name}: {e}")
+            logger.error("Error launching script {}: {}", hotkey_item.name, e)
 
     def add_hotkey(self, hotkey_item):
         logger.info(f"Adding hotkey: {hotkey_item.name}")
         self.hotkeys.append(hotkey_item)
         self.save_config()
-        self.register_all_hotkeys()
+        self._register_item(hotkey_item)
+        return len(self.hotkeys) - 1
 
     def update_hotkey(self, index, hotkey_item):
         if 0 <= index < len(self.hotkeys):
             logger.info(f"Updating hotkey: {hotkey_item.name}")
-            self.hotkeys[index] = hotkey_item
+            current = self.hotkeys[index]
+            self._env_cache.pop(id(current), None)
+            # A rename changes the log filename, so drop the old handle either
+            # way; the next trigger reopens under the current name.
+            if current._log_handle is not None and not current._log_handle.closed:
+                current._log_handle.close()
+            current._log_handle = None
+            if current._handle is not None and current.hotkey == hotkey_item.hotkey:
+                # The registered callback captured this object, so updating it
+                # in place keeps the existing hook valid.
+                current.script_path = hotkey_item.script_path
+                current.name = hotkey_item.name
+                current._safe_name = hotkey_item._safe_name
+                current.env_vars = hotkey_item.env_vars
+                current._env_summary = None
+            else:
+                self._unregister_item(current)
+                self.hotkeys[index] = hotkey_item
+                self._register_item(hotkey_item)
             self.save_config()
-            self.register_all_hotkeys()
 
     def remove_hotkey(self, index):
         if 0 <= index < len(self.hotkeys):
-            removed_name = self.hotkeys[index].name
-            logger.info(f"Removing hotkey: {removed_name}")
+            item = self.hotkeys[index]
+            logger.info(f"Removing hotkey: {item.name}")
+            self._env_cache.pop(id(item), None)
+            if item._log_handle is not None and not item._log_handle.closed:
+                item._log_handle.close()
+            self._unregister_item(item)
             del self.hotkeys[index]
             self.save_config()
-            self.register_all_hotkeys()
 
     def duplicate_hotkey(self, index):
         if 0 <= index < len(self.hotkeys):
@@ -400,13 +660,15 @@ class HotkeyManager:
             logger.info(f"Duplicating hotkey: {original.name} -> {duplicate.name}")
             self.hotkeys.append(duplicate)
             self.save_config()
-            self.register_all_hotkeys()
+            self._register_item(duplicate)
             return len(self.hotkeys) - 1
         return -1
 
     def set_global_env_vars(self, env_vars):
         logger.info(f"Setting {len(env_vars)} global environment variables.")
         self.global_env_vars = env_vars
+        self._base_env = {**os.environ, **self.global_env_vars}
+        self._env_cache.clear()
         self.save_config()
 
 
@@ -414,13 +676,16 @@ class EnvVarDialog(QDialog):
     def __init__(self, env_vars=None, parent=None):
         super().__init__(parent)
         AppStyles.setup_dialog_window(self, "Environment Variables", AppStyles.ENV_DIALOG_SIZE)
-        self.env_vars_initial = env_vars or {}
-
         self.env_table, self.add_var_button, self.remove_var_button, self.save_button, self.cancel_button = (
             AppStyles.setup_env_dialog_ui(self)
         )
 
         self.connect_signals()
+        self.load(env_vars)
+
+    def load(self, env_vars=None):
+        # The dialog is constructed once and reused; reset it per showing.
+        self.env_vars_initial = env_vars or {}
         self.populate_env_vars()
 
     def connect_signals(self):
@@ -430,12 +695,18 @@ class EnvVarDialog(QDialog):
         self.cancel_button.clicked.connect(self.reject)
 
     def populate_env_vars(self):
-        self.env_table.setRowCount(0)
-        for row, (key, value) in enumerate(self.env_vars_initial.items()):
-            self.env_table.insertRow(row)
-            self.env_table.setItem(row, 0, QTableWidgetItem(key))
-            self.env_table.setItem(row, 1, QTableWidgetItem(value))
-
+        self.env_table.setUpdatesEnabled(False)
+        self.env_table.blockSignals(True)
+        try:
+            self.env_table.setRowCount(len(self.env_vars_initial))
+            for row, (key, value) in enumerate(self.env_vars_initial.items()):
+                self.env_table.setItem(row, 0, QTableWidgetItem(key))
+                self.env_table.setItem(row, 1, QTableWidgetItem(value))
+        finally:
+            self.env_table.blockSignals(False)
+            self.env_table.setUpdatesEnabled(True)
+
+    @Slot()
     def add_env_var(self):
         row = self.env_table.rowCount()
         self.env_table.insertRow(row)
@@ -443,6 +714,7 @@ class EnvVarDialog(QDialog):
         self.env_table.setFocus()
         self.env_table.editItem(self.env_table.item(row, 0) or QTableWidgetItem(""))
 
+    @Slot()
     def remove_env_var(self):
         selected_rows = sorted(set(index.row() for index in self.env_table.selectedIndexes()), reverse=True)
         for row in selected_rows: self.env_table.removeRow(row)
@@ -457,23 +729,48 @@ class EnvVarDialog(QDialog):
         return env_vars
 
 
+# Qt key codes whose keyboard-library names differ from their QKeySequence
+# spelling; everything else falls back to QKeySequence(key).toString().
+_QT_KEY_NAMES = {
+    Qt.Key_Return: "enter",
+    Qt.Key_Enter: "enter",
+    Qt.Key_Backspace: "backspace",
+    Qt.Key_Delete: "delete",
+    Qt.Key_Insert: "insert",
+    Qt.Key_Home: "home",
+    Qt.Key_End: "end",
+    Qt.Key_PageUp: "page up",
+    Qt.Key_PageDown: "page down",
+    Qt.Key_Up: "up",
+    Qt.Key_Down: "down",
+    Qt.Key_Left: "left",
+    Qt.Key_Right: "right",
+    Qt.Key_Space: "space",
+    Qt.Key_Tab: "tab",
+}
+
+_QT_MODIFIER_KEYS = (Qt.Key_Control, Qt.Key_Shift, Qt.Key_Alt, Qt.Key_Meta, Qt.Key_AltGr)
+
+
 class HotkeyDialog(QDialog):
-    def __init__(self, hotkey_item=None, parent=None):
+    def __init__(self, hotkey_item=None, parent=None, manager=None):
         super().__init__(parent)
+        self._manager = manager
         AppStyles.setup_dialog_window(self, "Hotkey Configuration", AppStyles.HOTKEY_DIALOG_SIZE)
-        self.hotkey_item = hotkey_item or HotkeyItem()
-        self.recording = False
-        self.pressed_keys = set()
 
         (self.name_edit, self.hotkey_edit, self.script_edit, self.browse_button,
          self.env_count_label, self.env_button, self.save_button, self.cancel_button) = (
             AppStyles.setup_hotkey_dialog_ui(self)
         )
 
-        self.initialize_values()
+        self._env_dialog = EnvVarDialog(parent=self)
         self.connect_signals()
+        self.load(hotkey_item)
 
-    def initialize_values(self):
+    def load(self, hotkey_item=None):
+        # The dialog is constructed once and reused; reset it per showing.
+        self.hotkey_item = hotkey_item or HotkeyItem()
+        self.recording = False
         self.name_edit.setText(self.hotkey_item.name)
         self.hotkey_edit.setText(self.hotkey_item.hotkey)
         self.script_edit.setText(self.hotkey_item.script_path)
@@ -491,48 +788,63 @@ class HotkeyDialog(QDialog):
             self.recording = True
             self.original_hotkey = self.hotkey_edit.text()
             self.hotkey_edit.setText("Press hotkey combination...")
-            self.pressed_keys.clear()
-            keyboard.unhook_all()
-            keyboard.hook(self.on_key_event)
-
-    def on_key_event(self, event):
-        if self.recording and event.event_type == keyboard.KEY_DOWN:
-            try:
-                if event.scan_code == 1:
-                    logger.debug("Escape pressed, canceling hotkey recording")
-                    self.hotkey_edit.setText(self.original_hotkey)
-                    self.recording = False
-                    keyboard.unhook(self.on_key_event)
-                    return
-
-                hotkey = keyboard.read_hotkey()
-                logger.debug(f"Recorded hotkey: {hotkey}")
-                self.hotkey_edit.setText(hotkey)
-                self.recording = False
-                keyboard.unhook(self.on_key_event)
-
-                if self.parent() and hasattr(self.parent(), 'manager'):
-                    self.parent().manager.register_all_hotkeys()
-
-            except Exception as e:
-                logger.error(f"Error recording hotkey: {e}")
-                self.hotkey_edit.setText(self.original_hotkey)
-                self.recording = False
-                keyboard.unhook(self.on_key_event)
+            # The dialog has focus, so Qt's own key events cover recording;
+            # no system-wide keyboard hook to install (and forget to remove).
+            # The library's OS-level hooks stay live under grabKeyboard
+            # though, so pause dispatch: re-typing an existing binding must
+            # not launch its script mid-dialog.
+            if self._manager is not None:
+                self._manager.recording = True
+            self.grabKeyboard()
+
+    def _finish_recording(self, hotkey=None):
+        self.hotkey_edit.setText(hotkey if hotkey is not None else self.original_hotkey)
+        self.recording = False
+        if self._manager is not None:
+            self._manager.recording = False
+        self.releaseKeyboard()
 
-                if self.parent() and hasattr(self.parent(), 'manager'):
-                    self.parent().manager.register_all_hotkeys()
+    def keyPressEvent(self, event):
+        if not self.recording:
+            super().keyPressEvent(event)
+            return
+        key = event.key()
+        if key == Qt.Key_Escape:
+            logger.debug("Escape pressed, canceling hotkey recording")
+            self._finish_recording()
+            return
+        if key in _QT_MODIFIER_KEYS:
+            return  # wait for a non-modifier key to complete the combination
+        mods = []
+        modifiers = event.modifiers()
+        if modifiers & Qt.ControlModifier:
+            mods.append("ctrl")
+        if modifiers & Qt.AltModifier:
+            mods.append("alt")
+        if modifiers & Qt.ShiftModifier:
+            mods.append("shift")
+        if modifiers & Qt.MetaModifier:
+            mods.append("windows")
+        name = _QT_KEY_NAMES.get(key) or QKeySequence(key).toString().lower()
+        if not name:
+            return
+        hotkey = "+".join(mods + [name])
+        logger.debug(f"Recorded hotkey: {hotkey}")
+        self._finish_recording(hotkey)
 
+    @Slot()
     def browse_script(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Select Script", str(SCRIPTS_DIR), "Python Files (*.py)")
         if file_path:
             self.script_edit.setText(file_path)
             if not self.name_edit.text(): self.name_edit.setText(os.path.basename(file_path))
 
+    @Slot()
     def edit_env_vars(self):
-        dialog = EnvVarDialog(self.hotkey_item.env_vars, self)
-        if dialog.exec():
-            self.hotkey_item.env_vars = dialog.get_env_vars()
+        self._env_dialog.load(self.hotkey_item.env_vars)
+        if self._env_dialog.exec():
+            self.hotkey_item.env_vars = self._env_dialog.get_env_vars()
+            self.hotkey_item._env_summary = None
             self.env_count_label.setText(f"{len(self.hotkey_item.env_vars)} set")
 
     def get_hotkey_item(self):
@@ -545,16 +857,18 @@ class MainWindow(QDialog):
         super().__init__()
         self.manager = manager
         AppStyles.setup_dialog_window(self, APP_NAME, AppStyles.MAIN_WINDOW_SIZE, False)
-        if ICON_PATH.exists():
-            self.setWindowIcon(QIcon(str(ICON_PATH)))
-        else:
-            logger.warning(f"Icon file not found: {ICON_PATH}")
 
         (self.title_label, self.global_env_button, self.hotkey_table,
          self.add_button, self.edit_button, self.remove_button, self.duplicate_button, self.logs_button) = (
             AppStyles.setup_main_window_ui(self)
         )
 
+        # Dialogs are expensive to construct (widget creation plus style
+        # resolution); build each once and reset fields on reuse.
+        self._hotkey_dialog = HotkeyDialog(parent=self, manager=manager)
+        self._env_dialog = EnvVarDialog(parent=self)
+        self._env_dialog.setWindowTitle("Global Environment Variables")
+
         self.connect_signals()
         self.populate_hotkey_table()
 
@@ -567,68 +881,97 @@ class MainWindow(QDialog):
         self.duplicate_button.clicked.connect(self.duplicate_hotkey)
         self.logs_button.clicked.connect(self.open_logs_directory)
 
+    @Slot()
     def edit_global_env_vars(self):
-        dialog = EnvVarDialog(self.manager.global_env_vars, self)
-        dialog.setWindowTitle("Global Environment Variables")
-        if dialog.exec():
-            self.manager.set_global_env_vars(dialog.get_env_vars())
+        self._env_dialog.load(self.manager.global_env_vars)
+        if self._env_dialog.exec():
+            self.manager.set_global_env_vars(self._env_dialog.get_env_vars())
 
+    @Slot()
     def open_logs_directory(self):
         logger.info(f"Opening logs directory: {LOGS_DIR}")
         if LOGS_DIR.exists():
-            try:
-                if sys.platform == 'win32':
-                    os.startfile(LOGS_DIR)
-                elif sys.platform == 'darwin':
-                    subprocess.call(['open', LOGS_DIR])
-                else:
-                    subprocess.call(['xdg-open', LOGS_DIR])
-            except Exception as e:
-                logger.error(f"Could not open logs directory {LOGS_DIR}: {e}")
+            # Non-blocking and cross-platform, unlike the old subprocess.call
+            # branch which held the event loop until xdg-open/open returned.
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(LOGS_DIR))):
+                logger.error(f"Could not open logs directory {LOGS_DIR}")
                 QMessageBox.warning(self, "Error", f"Could not open logs directory:\n{LOGS_DIR}")
         else:
             QMessageBox.warning(self, "Error", "Logs directory not found.")
 
-    def populate_hotkey_table(self):
-        self.hotkey_table.setRowCount(0)
-        for i, item in enumerate(self.manager.hotkeys):
-            self.hotkey_table.insertRow(i)
-            self.hotkey_table.setItem(i, 0, QTableWidgetItem(item.hotkey))
-            self.hotkey_table.setItem(i, 1, QTableWidgetItem(item.name))
-            env_text = f"{len(item.env_vars)} vars" if item.env_vars else ""
-            if item.env_vars:
-                env_keys = list(item.env_vars.keys())
-                if len(env_keys) <= 3:
-                    env_text = ", ".join(env_keys)
-                else:
-                    env_text = f"({len(env_keys)}) " + ", ".join(env_keys[:2]) + "..."
-            self.hotkey_table.setItem(i, 2, QTableWidgetItem(env_text))
-            self.hotkey_table.setItem(i, 3, QTableWidgetItem(item.script_path))
-        self.hotkey_table.resizeColumnsToContents()
+    def _set_row(self, row, item):
+        # Reuse existing cell items where possible: QTableWidgetItem
+        # construction is the expensive part of a refresh, and setText on a
+        # live item is just a string swap plus a repaint.
+        table = self.hotkey_table
+        for col, text in ((0, item.hotkey), (1, item.name), (2, item.env_summary), (3, item.script_path)):
+            cell = table.item(row, col)
+            if cell is None:
+                table.setItem(row, col, QTableWidgetItem(text))
+            else:
+                cell.setText(text)
+
+    def _write_row(self, row, item, insert=False):
+        # One repaint per edit rather than one per touched cell.
+        table = self.hotkey_table
+        table.setUpdatesEnabled(False)
+        try:
+            if insert:
+                table.insertRow(row)
+            self._set_row(row, item)
+        finally:
+            table.setUpdatesEnabled(True)
 
+    def populate_hotkey_table(self):
+        # Full rebuild, for initial load only; edits touch single rows.
+        # Row-by-row insertRow/setItem triggers a relayout and repaint per
+        # cell; suspend updates and size the table once up front.
+        table = self.hotkey_table
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(self.manager.hotkeys))
+            for i, item in enumerate(self.manager.hotkeys):
+                self._set_row(i, item)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting)
+
+    @Slot()
     def add_hotkey(self):
-        dialog = HotkeyDialog(parent=self)
+        dialog = self._hotkey_dialog
+        dialog.load()
         if dialog.exec():
-            self.manager.add_hotkey(dialog.get_hotkey_item())
-            self.populate_hotkey_table()
+            item = dialog.get_hotkey_item()
+            row = self.manager.add_hotkey(item)
+            self._write_row(row, item, insert=True)
 
+    @Slot()
+    @Slot(QModelIndex)
     def edit_hotkey(self, index=None):
         row = index.row() if isinstance(index, QModelIndex) and index.isValid() else self.hotkey_table.currentRow()
         if 0 <= row < len(self.manager.hotkeys):
-            dialog = HotkeyDialog(self.manager.hotkeys[row], parent=self)
+            dialog = self._hotkey_dialog
+            dialog.load(self.manager.hotkeys[row])
             if dialog.exec():
-                self.manager.update_hotkey(row, dialog.get_hotkey_item())
-                self.populate_hotkey_table()
+                item = dialog.get_hotkey_item()
+                self.manager.update_hotkey(row, item)
+                self._write_row(row, item)
 
+    @Slot()
     def duplicate_hotkey(self):
         row = self.hotkey_table.currentRow()
         if row >= 0:
             new_index = self.manager.duplicate_hotkey(row)
             if new_index >= 0:
-                self.populate_hotkey_table()
+                self._write_row(new_index, self.manager.hotkeys[new_index], insert=True)
                 self.hotkey_table.selectRow(new_index)
                 logger.info(f"Duplicated hotkey at index {row} to index {new_index}")
 
+    @Slot()
     def remove_hotkey(self):
         row = self.hotkey_table.currentRow()
         if row >= 0:
@@ -637,7 +980,7 @@ class MainWindow(QDialog):
                     self, "Confirm Removal", f"Remove '{item_name}'?", QMessageBox.Yes | QMessageBox.No
             ) == QMessageBox.Yes:
                 self.manager.remove_hotkey(row)
-                self.populate_hotkey_table()
+                self.hotkey_table.removeRow(row)
 
     def closeEvent(self, event):
         self.hide()
@@ -659,10 +1002,15 @@ if __name__ == "__main__":
     if not ICON_PATH.exists():
         logger.error(f"Required icon file not found at {ICON_PATH}, tray icon may be missing.")
 
+    # One decode for the tray, the main window and every dialog: windows
+    # inherit the application icon, so nothing reloads the PNG.
+    app_icon = QIcon(ICON_PATH_STR) if ICON_PATH.exists() else QIcon()
+    app.setWindowIcon(app_icon)
+
     hotkey_manager = HotkeyManager()
     main_window = MainWindow(hotkey_manager)
 
-    tray_icon = QSystemTrayIcon(QIcon(str(ICON_PATH)) if ICON_PATH.exists() else QIcon())
+    tray_icon = QSystemTrayIcon(app_icon)
     tray_menu = QMenu()
 
     open_action = QAction("Open Manager")
@@ -671,17 +1019,25 @@ if __name__ == "__main__":
     logs_action = QAction("View Logs")
     logs_action.triggered.connect(main_window.open_logs_directory)
     tray_menu.addAction(logs_action)
+    def on_quit():
+        logger.info("Quitting application.")
+        hotkey_manager.flush_pending_save()
+        app.quit()
+
+    def on_tray_activated(reason):
+        if reason == QSystemTrayIcon.ActivationReason.Trigger:
+            main_window.show()
+
     quit_action = QAction("Quit")
-    quit_action.triggered.connect(lambda: logger.info("Quitting application.") or app.quit())
+    quit_action.triggered.connect(on_quit)
     tray_menu.addAction(quit_action)
 
     tray_icon.setContextMenu(tray_menu)
-    tray_icon.activated.connect(
-        lambda reason: main_window.show() if reason == QSystemTrayIcon.ActivationReason.Trigger else None
-    )
+    tray_icon.activated.connect(on_tray_activated)
     tray_icon.show()
     logger.info("System tray icon active.")
 
     hotkey_manager.register_all_hotkeys()
+    hotkey_manager.prewarm()
     logger.info(f"{APP_NAME} is running.")
     sys.exit(app.exec())
\ No newline at end of file